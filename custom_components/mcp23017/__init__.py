@@ -1,10 +1,8 @@
 """Support for I2C MCP23017 chip."""
 
 import asyncio
-import functools
 import logging
 import threading
-import time
 
 import smbus2
 
@@ -19,55 +17,80 @@ from .const import (
     DEFAULT_I2C_BUS,
     DEFAULT_SCAN_RATE,
     DOMAIN,
+    MAX_SCAN_RATE,
 )
 
-# MCP23017 Register Map (IOCON.BANK = 1, MCP23008-compatible)
-IODIRA = 0x00
-IODIRB = 0x10
-IPOLA = 0x01
-IPOLB = 0x11
-GPINTENA = 0x02
-GPINTENB = 0x12
-DEFVALA = 0x03
-DEFVALB = 0x13
-INTCONA = 0x04
-INTCONB = 0x14
-IOCONA = 0x05
-IOCONB = 0x15
-GPPUA = 0x06
-GPPUB = 0x16
-INTFA = 0x07
-INTFB = 0x17
-INTCAPA = 0x08
-INTCAPB = 0x18
-GPIOA = 0x09
-GPIOB = 0x19
-OLATA = 0x0a
-OLATB = 0x1a
+# MCP23017 Register Map, given as MCP23008-compatible register offsets
+# - IOCON.BANK = 0 (MCP23017 only): A/B pairs are adjacent, address = (offset << 1) | bank
+# - IOCON.BANK = 1 (MCP23008-compatible): address = offset | (bank << 4)
+IODIR = 0x00
+IPOL = 0x01
+GPINTEN = 0x02
+DEFVAL = 0x03
+INTCON = 0x04
+IOCON = 0x05
+GPPU = 0x06
+INTF = 0x07
+INTCAP = 0x08
+GPIO = 0x09
+OLAT = 0x0a
 
 # Register address used to toggle IOCON.BANK to 1 (only mapped when BANK is 0)
 IOCON_REMAP = 0x0b
 
+# 16-bit registers (bank B in MSB) accessed by the driver
+REGISTERS = {
+    "IODIR": IODIR,
+    "GPINTEN": GPINTEN,
+    "GPPU": GPPU,
+    "INTF": INTF,
+    "INTCAP": INTCAP,
+    "GPIO": GPIO,
+    "OLAT": OLAT,
+}
+# Registers mirrored in the device cache
+CACHED_REGISTERS = ("IODIR", "GPINTEN", "GPPU", "GPIO", "OLAT")
+# Configuration registers with deferred writes, in flush order (OLAT before IODIR)
+CONFIG_REGISTERS = ("OLAT", "IODIR", "GPPU", "GPINTEN")
+
+# Set/clear masks of each pin in a 16-bit register
+_BIT = tuple(1 << pin for pin in range(16))
+_NBIT = tuple(~(1 << pin) & 0xFFFF for pin in range(16))
+
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["binary_sensor", "switch"]
 
-MCP23017_DATA_LOCK = asyncio.Lock()
+# DOMAIN data async mutexes, one per i2c address (created on first use)
+MCP23017_DATA_LOCKS = {}
+
+# Shared SMBus handles, one (SMBus, lock) per I2C bus
+# - smbus2 keeps the slave address as handle state, hence the lock around each transaction
+_BUS_CACHE = {}
+_BUS_CACHE_LOCK = threading.Lock()
 
 class SetupEntryStatus:
     """Class registering the number of outstanding async_setup_entry calls."""
     def __init__(self):
-        """Initialize call counter."""
+        """Initialize call counter and idle event."""
         self.number = 0
-    def __enter__(self):
-        """Increment call counter (with statement)."""
-        self.number +=1
-    def __exit__(self, exc_type, exc_value, exc_tb):
-        """Decrement call counter (with statement)."""
-        self.number -=1
+        self._idle = asyncio.Event()
+        self._idle.set()
     def busy(self):
         """Return True when there is at least one outstanding call"""
         return self.number != 0
+    def enter(self):
+        """Register an outstanding call."""
+        self.number += 1
+        self._idle.clear()
+    def leave(self):
+        """Unregister an outstanding call."""
+        self.number -= 1
+        if not self.number:
+            self._idle.set()
+    async def wait_idle(self):
+        """Wait until there are no outstanding calls."""
+        await self._idle.wait()
 
 setup_entry_status = SetupEntryStatus()
 
@@ -81,13 +104,13 @@ async def async_setup(hass, config):
     # Callback function to start polling when HA starts
     def start_polling(event):
         for component in hass.data[DOMAIN].values():
-            if not component.is_alive():
+            if not component.is_polling:
                 component.start_polling()
 
     # Callback function to stop polling when HA stops
     def stop_polling(event):
         for component in hass.data[DOMAIN].values():
-            if component.is_alive():
+            if component.is_polling:
                 component.stop_polling()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, start_polling)
@@ -100,11 +123,14 @@ async def async_setup_entry(hass, config_entry):
     """Set up the MCP23017 from a config entry."""
 
     # Register this setup instance
-    with setup_entry_status:
+    setup_entry_status.enter()
+    try:
         # Forward entry setup to configured platform
         await hass.config_entries.async_forward_entry_setups(
             config_entry, [config_entry.data[CONF_FLOW_PLATFORM]]
         )
+    finally:
+        setup_entry_status.leave()
 
     return True
 
@@ -119,20 +145,18 @@ async def async_unload_entry(hass, config_entry):
     i2c_address = config_entry.data[CONF_I2C_ADDRESS]
 
     # DOMAIN data async mutex
-    async with MCP23017_DATA_LOCK:
+    async with MCP23017_DATA_LOCKS.setdefault(i2c_address, asyncio.Lock()):
         if i2c_address in hass.data[DOMAIN]:
             component = hass.data[DOMAIN][i2c_address]
 
             # Unlink entity from component
             await hass.async_add_executor_job(
-                functools.partial(
-                    component.unregister_entity, config_entry.data[CONF_FLOW_PIN_NUMBER]
-                )
+                component.unregister_entity, config_entry.data[CONF_FLOW_PIN_NUMBER]
             )
 
             # Free component if not linked to any entities
             if component.has_no_entities:
-                if component.is_alive():
+                if component.is_polling:
                     await hass.async_add_executor_job(component.stop_polling)
                 hass.data[DOMAIN].pop(i2c_address)
 
@@ -144,7 +168,7 @@ async def async_unload_entry(hass, config_entry):
         else:
             _LOGGER.warning(
                 "%s@0x%02x component not found, unable to unload entity (pin %d).",
-                f"{DOMAIN}@0x{i2c_address:02x}",
+                DOMAIN,
                 i2c_address,
                 config_entry.data[CONF_FLOW_PIN_NUMBER],
             )
@@ -153,25 +177,32 @@ async def async_unload_entry(hass, config_entry):
 
 
 async def async_get_or_create(hass, config_entry, entity):
-    """Get or create a MCP23017 component from entity i2c address."""
+    """Get or create a MCP23017 component from entity i2c address.
+
+    Entity is attached to the component and configured (entity.device is set).
+    """
 
     i2c_address = entity.address
 
     # DOMAIN data async mutex
     try:
-        async with MCP23017_DATA_LOCK:
-            if i2c_address in hass.data[DOMAIN]:
-                component = hass.data[DOMAIN][i2c_address]
-            else:
-                # Try to create component when it doesn't exist
-                component = await hass.async_add_executor_job(
-                    functools.partial(MCP23017, DEFAULT_I2C_BUS, i2c_address)
-                )
+        async with MCP23017_DATA_LOCKS.setdefault(i2c_address, asyncio.Lock()):
+            # Link entity to component, creating it when it doesn't exist, and configure
+            # it (single job)
+            component = await hass.async_add_executor_job(
+                _get_or_create_and_register,
+                hass,
+                hass.data[DOMAIN].get(i2c_address),
+                i2c_address,
+                entity,
+            )
+
+            if i2c_address not in hass.data[DOMAIN]:
                 hass.data[DOMAIN][i2c_address] = component
 
-                # Start polling thread if hass is already running
+                # Start polling if hass is already running
                 if hass.is_running:
-                    component.start_polling()
+                    await hass.async_add_executor_job(component.start_polling)
 
                 # Register a device combining all related entities
                 devices = device_registry.async_get(hass)
@@ -183,11 +214,6 @@ async def async_get_or_create(hass, config_entry, entity):
                     name=f"{DOMAIN}@0x{i2c_address:02x}",
                 )
 
-            # Link entity to component
-            await hass.async_add_executor_job(
-                functools.partial(component.register_entity, entity)
-            )
-
     except ValueError as error:
         component = None
         await hass.config_entries.async_remove(config_entry.entry_id)
@@ -202,25 +228,69 @@ async def async_get_or_create(hass, config_entry, entity):
     return component
 
 
-def i2c_device_exist(address):
+def _get_or_create_and_register(hass, component, address, entity):
+    """Attach {entity} to {component}, creating it at {address} when None (blocking).
+
+    Entity is configured before being registered, i.e. before its initial update.
+    """
+    if component is None:
+        component = MCP23017(hass, DEFAULT_I2C_BUS, address)
+    entity.device = component
+    entity.configure_device()
+    component.register_entity(entity)
+    # Deferred configuration is written by the poller once running; until then (HA
+    # startup) write it now so that pins don't keep their previous state meanwhile
+    if not component.is_polling:
+        try:
+            with component:
+                component._flush()
+        except OSError as error:
+            _LOGGER.warning(
+                "%s configuration deferred to first scan (%s)",
+                component.unique_id,
+                error,
+            )
+    return component
+
+
+def _get_bus(bus):
+    """Return shared (SMBus, lock) for I2C {bus}, opening it on first use."""
+    with _BUS_CACHE_LOCK:
+        if bus not in _BUS_CACHE:
+            _BUS_CACHE[bus] = (smbus2.SMBus(bus), threading.Lock())
+        return _BUS_CACHE[bus]
+
+
+def i2c_device_exist(bus, address):
+    """Probe {address} on I2C {bus} using the shared bus handle (blocking)."""
     try:
-        smbus2.SMBus(DEFAULT_I2C_BUS).read_byte(address)
-    except (FileNotFoundError, OSError) as error:
+        smbus, bus_lock = _get_bus(bus)
+        with bus_lock:
+            smbus.read_byte(address)
+    except (FileNotFoundError, OSError):
         return False
     return True
 
 
-class MCP23017(threading.Thread):
+class MCP23017:
     """MCP23017 device driver."""
 
-    def __init__(self, bus, address):
+    def __init__(self, hass, bus, address):
         """Create a MCP23017 instance at {address} on I2C {bus}."""
         self._address = address
+        self._bus_number = bus
+        # Bus polling thread while polled, see start_polling
+        self._poller = None
+        self._poller_lock = threading.Lock()
+        # Entity callbacks and executor jobs are scheduled on the hass event loop
+        self._hass = hass
+        self._loop = hass.loop
 
         # Check device presence
         try:
-            self._bus = smbus2.SMBus(bus)
-            self._bus.read_byte(self._address)
+            self._bus, self._bus_lock = _get_bus(bus)
+            with self._bus_lock:
+                self._bus.read_byte(self._address)
         except (FileNotFoundError, OSError) as error:
             _LOGGER.error(
                 "Unable to access %s (%s)",
@@ -229,25 +299,68 @@ class MCP23017(threading.Thread):
             )
             raise ValueError(error) from error
 
-        # Change register map (IOCON.BANK = 1) to support/make it compatible with MCP23008
+        # SMBus-only adapters may not support I2C block reads, see _read_block
+        self._block_read = bool(self._bus.funcs & smbus2.I2cFunc.SMBUS_READ_I2C_BLOCK)
+
+        try:
+            self._init_device()
+        except OSError as error:
+            _LOGGER.error(
+                "Unable to initialize %s (%s)",
+                self.unique_id,
+                error,
+            )
+            raise ValueError(error) from error
+
+        self._device_lock = threading.Lock()
+        # Pins of configuration registers whose cache is not written to the device yet
+        self._dirty = {register: 0 for register in CONFIG_REGISTERS}
+        # Entities attached to this device, by pin number
+        self._entities = {}
+        # async_push_update callback of each pin (None if not any) and bitmap of such pins
+        self._push_callbacks = [None for i in range(16)]
+        self._push_mask = 0
+        self._update_bitmap = 0
+        # Output values requested from the event loop, not handed over to the executor yet
+        self._pending_mask = 0
+        self._pending_value = 0
+        # Write task collecting pending values and last write task (keeps write order)
+        self._pending_write = None
+        self._last_write = None
+
+        _LOGGER.info("%s device created", self.unique_id)
+
+    def _init_device(self):
+        """Set up register map and interrupt logic, then load register cache."""
+        # Change register map (IOCON.BANK = 1) to make it compatible with MCP23008
         # - Note: when BANK is already set to 1, e.g. HA restart without power cycle,
         #   IOCON_REMAP address is not mapped and write is ignored
         self[IOCON_REMAP] = self[IOCON_REMAP] | 0x80
 
-        self._device_lock = threading.Lock()
-        self._run = False
-        self._cache = {
-            "IODIR": (self[IODIRB] << 8) + self[IODIRA],
-            "GPPU": (self[GPPUB] << 8) + self[GPPUA],
-            "GPIO": (self[GPIOB] << 8) + self[GPIOA],
-            "OLAT": (self[OLATB] << 8) + self[OLATA],
+        # IOCON.BANK is not implemented on MCP23008 (read as 0); switch MCP23017 back
+        # to IOCON.BANK = 0 so that A/B register pairs can be accessed in one transaction
+        # - IOCON.MIRROR = 1: INTA/INTB are ORed so that a single INT line covers both banks
+        self._sequential = bool(self[IOCON] & 0x80)
+        if self._sequential:
+            self[IOCON] = self[IOCON] & 0x7F | 0x40
+
+        # (bank A, bank B) addresses of registers for this register map
+        self._registers = {
+            register: (
+                self._register_address(offset, 0),
+                self._register_address(offset, 1),
+            )
+            for register, offset in REGISTERS.items()
         }
-        self._entities = [None for i in range(16)]
-        self._update_bitmap = 0
 
-        threading.Thread.__init__(self, name=self.unique_id)
+        # Interrupt-on-change compares against previous pin value (INTCON = 0); it is
+        # enabled (GPINTEN) for pins with a push callback, see register_entity
+        # - GPINTEN is reset as it survives HA restarts without power cycle
+        self[self._register_address(INTCON, 0)] = 0x00
+        self[self._register_address(INTCON, 1)] = 0x00
+        self._write_word("GPINTEN", 0x0000)
 
-        _LOGGER.info("%s device created", self.unique_id)
+        self._cache = self._read_cached_registers()
 
     def __enter__(self):
         """Lock access to device (with statement)."""
@@ -261,38 +374,140 @@ class MCP23017(threading.Thread):
 
     def __setitem__(self, register, value):
         """Set MCP23017 {register} to {value}."""
-        self._bus.write_byte_data(self._address, register, value)
+        with self._bus_lock:
+            self._bus.write_byte_data(self._address, register, value)
 
     def __getitem__(self, register):
         """Get value of MCP23017 {register}."""
-        data = self._bus.read_byte_data(self._address, register)
+        with self._bus_lock:
+            data = self._bus.read_byte_data(self._address, register)
         return data
 
+    def _register_address(self, register, bank):
+        """Return address of MCP23017 {register} for {bank} (0 = A, 1 = B)."""
+        if self._sequential:
+            return (register << 1) | bank
+        return register | (bank << 4)
+
+    def _read_block(self, register, length):
+        """Get {length} registers from {register} (first in LSB) in one transaction.
+
+        A/B register pairs use SMBus word transfers (LSB first), which are supported
+        by more I2C adapters than I2C block transfers; without I2C block read support,
+        longer blocks are split into word (and byte) transfers.
+        """
+        with self._bus_lock:
+            if length == 1:
+                return self._bus.read_byte_data(self._address, register)
+            if length == 2:
+                return self._bus.read_word_data(self._address, register)
+            if self._block_read:
+                data = self._bus.read_i2c_block_data(self._address, register, length)
+                return int.from_bytes(bytes(data), "little")
+            value = 0
+            for offset in range(0, length - 1, 2):
+                word = self._bus.read_word_data(self._address, register + offset)
+                value |= word << (offset << 3)
+            if length & 1:
+                byte = self._bus.read_byte_data(self._address, register + length - 1)
+                value |= byte << ((length - 1) << 3)
+        return value
+
+    def _read_cached_registers(self):
+        """Get all CACHED_REGISTERS by reading the register file at once.
+
+        One transaction covers both banks when A/B registers are adjacent
+        (IOCON.BANK = 0), one transaction per bank otherwise.
+        """
+        length = OLAT + 1
+        if self._sequential:
+            data = self._read_block(self._register_address(IODIR, 0), 2 * length)
+            return {
+                register: (data >> (REGISTERS[register] << 4)) & 0xFFFF
+                for register in CACHED_REGISTERS
+            }
+        data_a = self._read_block(self._register_address(IODIR, 0), length)
+        data_b = self._read_block(self._register_address(IODIR, 1), length)
+        return {
+            register: ((data_a >> (REGISTERS[register] << 3)) & 0xFF)
+            | (((data_b >> (REGISTERS[register] << 3)) & 0xFF) << 8)
+            for register in CACHED_REGISTERS
+        }
+
+    def _write_word(self, register, value):
+        """Set MCP23017 {register} for both banks (B in MSB) to {value}.
+
+        A single SMBus word transfer (LSB first) is used when A/B registers are
+        adjacent (IOCON.BANK = 0).
+        """
+        if self._sequential:
+            with self._bus_lock:
+                self._bus.write_word_data(
+                    self._address, self._registers[register][0], value
+                )
+        else:
+            self[self._registers[register][0]] = value & 0xFF
+            self[self._registers[register][1]] = (value >> 8) & 0xFF
+
     def _get_register_value(self, register, bit):
         """Get MCP23017 {bit} of {register}."""
+        cache_old = self._cache[register]
         if bit < 8:
-            value = self[globals()[register + "A"]] & 0xFF
+            value = self[self._registers[register][0]] & 0xFF
             self._cache[register] = self._cache[register] & 0xFF00 | value
         else:
-            value = self[globals()[register + "B"]] & 0xFF
+            value = self[self._registers[register][1]] & 0xFF
             self._cache[register] = self._cache[register] & 0x00FF | (value << 8)
 
-        return bool(self._cache[register] & (1 << bit))
+        # GPIO read clears INTF, hand input changes it revealed over to the poller
+        if register == "GPIO":
+            self._update_bitmap |= (cache_old ^ self._cache[register]) & self._push_mask
+
+        return bool(self._cache[register] & _BIT[bit])
+
+    def _cache_matches(self, register, mask, value):
+        """Check if {mask} bits of cached {register} match {value} (no lock required).
+
+        Cache is only modified under the device lock and an int read is atomic, so this
+        allows no-op calls to return without acquiring the lock.
+        """
+        return not (self._cache[register] ^ value) & mask
 
     def _set_register_value(self, register, bit, value):
-        """Set MCP23017 {bit} of {register} to {value}."""
+        """Set MCP23017 {bit} of {register} to {value} (cache only, see _flush)."""
         # Update cache
         cache_old = self._cache[register]
         if value:
-            self._cache[register] |= (1 << bit) & 0xFFFF
+            self._cache[register] |= _BIT[bit]
         else:
-            self._cache[register] &= ~(1 << bit) & 0xFFFF
-        # Update device register only if required (minimize # of I2C  transactions)
+            self._cache[register] &= _NBIT[bit]
+        # Mark device register for update only if required (minimize # of I2C writes)
         if cache_old != self._cache[register]:
-            if bit < 8:
-                self[globals()[register + "A"]] = self._cache[register] & 0xFF
+            self._dirty[register] |= _BIT[bit]
+            # Pin (re)configuration may change its level without flagging INTF
+            if register != "OLAT":
+                self._update_bitmap |= _BIT[bit]
+                if self._push_mask & _BIT[bit]:
+                    self.wake()
+
+    def _flush(self):
+        """Write pending configuration changes, at most once per register bank.
+
+        Pin configurations of entities set up in a row (e.g. at HA startup) are
+        merged this way; they are flushed by the polling thread at each scan, by
+        hardware reads and by output value changes (device lock required).
+        """
+        for register in CONFIG_REGISTERS:
+            dirty = self._dirty[register]
+            if not dirty:
+                continue
+            if dirty & 0x00FF and dirty & 0xFF00:
+                self._write_word(register, self._cache[register])
+            elif dirty & 0x00FF:
+                self[self._registers[register][0]] = self._cache[register] & 0xFF
             else:
-                self[globals()[register + "B"]] = (self._cache[register] >> 8) & 0xFF
+                self[self._registers[register][1]] = (self._cache[register] >> 8) & 0xFF
+            self._dirty[register] = 0
 
     @property
     def address(self):
@@ -307,37 +522,92 @@ class MCP23017(threading.Thread):
     @property
     def has_no_entities(self):
         """Check if there are no more entities attached."""
-        return not any(self._entities)
+        return not self._entities
 
-    # -- Called from HA thread pool
+    # -- Called from HA event loop
 
-    def get_pin_value(self, pin):
-        """Get MCP23017 GPIO[{pin}] value."""
-        with self:
-            return self._get_register_value("GPIO", pin)
+    async def async_set_pin_value(self, pin, value):
+        """Set MCP23017 GPIO[{pin}] to {value}.
 
-    def set_pin_value(self, pin, value):
-        """Set MCP23017 GPIO[{pin}] to {value}."""
-        with self:
-            self._set_register_value("OLAT", pin, value)
+        Output changes requested during the same event loop iteration (e.g. scene
+        activation) are merged into a single executor job and OLAT write.
+        """
+        self._pending_mask |= _BIT[pin]
+        if value:
+            self._pending_value |= _BIT[pin]
+        else:
+            self._pending_value &= _NBIT[pin]
+        if self._pending_write is None:
+            self._pending_write = self._last_write = self._hass.async_create_task(
+                self._async_write_pending(self._last_write)
+            )
+        # Shared by all requesters, none of them may cancel it
+        await asyncio.shield(self._pending_write)
+
+    async def _async_write_pending(self, previous):
+        """Hand pending output values over to the executor after {previous} write."""
+        # Let requests of this event loop iteration join in; also required when the
+        # task starts eagerly, _pending_write is only assigned once this step returns
+        await asyncio.sleep(0)
+        # Writes are handed over in request order, later requests keep joining in
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        mask, value = self._pending_mask, self._pending_value
+        self._pending_mask = self._pending_value = 0
+        self._pending_write = None
+        await self._hass.async_add_executor_job(self.set_pins_value, mask, value)
 
-    def set_input(self, pin, is_input):
-        """Set MCP23017 GPIO[{pin}] as input."""
+    # -- Called from HA thread pool
+
+    def set_pins_value(self, mask, value):
+        """Set MCP23017 GPIO[pin] to bit pin of {value} for pins set in {mask}."""
+        # Pending OLAT writes still have to be driven now
+        if self._cache_matches("OLAT", mask, value) and not self._dirty["OLAT"]:
+            return
         with self:
-            self._set_register_value("IODIR", pin, is_input)
+            cache_old = self._cache["OLAT"]
+            self._cache["OLAT"] = cache_old & ~mask | value & mask
+            self._dirty["OLAT"] |= cache_old ^ self._cache["OLAT"]
+            self._flush()
 
     def set_pullup(self, pin, is_pullup):
-        """Set MCP23017 GPIO[{pin}] as pullup."""
+        """Set MCP23017 GPIO[{pin}] as pullup (deferred, see _flush)."""
+        if self._cache_matches("GPPU", _BIT[pin], _BIT[pin] if is_pullup else 0):
+            return
         with self:
             self._set_register_value("GPPU", pin, is_pullup)
 
+    def configure_pin(self, pin, is_input, is_pullup=None, value=None, readback=False):
+        """Configure MCP23017 GPIO[{pin}] direction, pullup and output value at once.
+
+        Output value is set before direction to avoid glitches.
+        None leaves the corresponding setting unchanged.
+        Writes are deferred, see _flush, unless {readback} is set: configuration
+        is then written and GPIO[{pin}] value is returned (single lock hold).
+        """
+        with self:
+            if value is not None:
+                self._set_register_value("OLAT", pin, value)
+            self._set_register_value("IODIR", pin, is_input)
+            if is_pullup is not None:
+                self._set_register_value("GPPU", pin, is_pullup)
+            if readback:
+                self._flush()
+                return self._get_register_value("GPIO", pin)
+        return None
+
     def register_entity(self, entity):
         """Register entity to this device instance."""
         with self:
             self._entities[entity.pin] = entity
+            self._push_callbacks[entity.pin] = getattr(entity, "async_push_update", None)
+            if self._push_callbacks[entity.pin]:
+                self._push_mask |= _BIT[entity.pin]
+                self._set_register_value("GPINTEN", entity.pin, True)
 
             # Trigger a callback to update initial state
-            self._update_bitmap |= (1 << entity.pin) & 0xFFFF
+            self._update_bitmap |= _BIT[entity.pin]
+            self.wake()
 
             _LOGGER.info(
                 "%s(pin %d:'%s') attached to %s",
@@ -352,9 +622,12 @@ class MCP23017(threading.Thread):
     def unregister_entity(self, pin_number):
         """Unregister entity from the device."""
         with self:
-            entity = self._entities[pin_number]
+            entity = self._entities.pop(pin_number)
             entity.unsubscribe_update_listener()
-            self._entities[pin_number] = None
+            self._push_callbacks[pin_number] = None
+            self._push_mask &= _NBIT[pin_number]
+            self._set_register_value("GPINTEN", pin_number, False)
+            self._flush()
 
             _LOGGER.info(
                 "%s(pin %d:'%s') removed from %s",
@@ -364,50 +637,203 @@ class MCP23017(threading.Thread):
                 self.unique_id,
             )
 
-    # -- Threading components
+    def _read_inputs(self):
+        """Return (INTCAP, GPIO) values of pins with an async_push_update callback.
+
+        Reads are limited to banks with associated callbacks and either a change
+        flagged in INTF or pending updates (minimize # of I2C transactions);
+        other bits are taken from the GPIO cache.
+        """
+        captured = input_state = self._cache["GPIO"]
+        if self._sequential:
+            # Both banks are handled in a single transaction per register
+            banks = ((0, 0xFFFF, 2),)
+        else:
+            banks = ((0, 0x00FF, 1), (1, 0xFF00, 1))
+
+        for bank, mask, length in banks:
+            if not self._push_mask & mask:
+                continue
+            shift = bank << 3
+            intf = self._read_block(self._registers["INTF"][bank], length) << shift
+            if intf:
+                # INTCAP and GPIO are adjacent, INTCAP is valid only when INTF is set
+                # - reading them also clears interrupts of pins without push callback
+                #   (e.g. unregistered), which would otherwise mask later changes
+                data = self._read_block(self._registers["INTCAP"][bank], 2 * length)
+                intcap = (data & ((1 << (length << 3)) - 1)) << shift
+                gpio = (data >> (length << 3)) << shift
+                # INTCAP is only refreshed for banks flagged in INTF, GPIO is used
+                # for the other bank to avoid reporting stale values as pulses
+                for bank_mask in (0x00FF, 0xFF00):
+                    if not intf & bank_mask:
+                        intcap = intcap & ~bank_mask | gpio & bank_mask
+            elif self._update_bitmap & self._push_mask & mask:
+                intcap = gpio = (
+                    self._read_block(self._registers["GPIO"][bank], length) << shift
+                )
+            else:
+                continue
+            captured = captured & ~mask | intcap
+            input_state = input_state & ~mask | gpio
+
+        return captured, input_state
+
+    # -- Polling components (called from the bus polling thread, see _BusPoller)
+
+    def wake(self):
+        """Request an immediate scan (e.g. pending updates) and reset back-off."""
+        poller = self._poller
+        if poller:
+            poller.wake()
+
+    @property
+    def is_polling(self):
+        """Check if the device is polled."""
+        return self._poller is not None
 
     def start_polling(self):
-        """Start polling thread."""
-        self._run = True
-        self.start()
+        """Add device to the polling thread of its bus (no-op if already polling)."""
+        with self._poller_lock:
+            if self._poller is not None:
+                return
+            self._poller = _BusPoller.add(self._bus_number, self)
+        _LOGGER.info("%s start polling", self.unique_id)
 
     def stop_polling(self):
-        """Stop polling thread."""
-        self._run = False
-        self.join()
+        """Remove device from the polling thread of its bus (no-op if not polling)."""
+        with self._poller_lock:
+            if self._poller is None:
+                return
+            self._poller.remove(self)
+            self._poller = None
+        _LOGGER.info("%s stop polling", self.unique_id)
+
+    def scan(self):
+        """Poll all ports once and call corresponding callback if a change is detected.
+
+        Return True when a change is detected.
+        """
+        with self:
+            self._flush()
+            captured, input_state = self._read_inputs()
+
+            # Check pin values that changed and update input cache
+            # - pulsed: pins that toggled back since last scan (latched in INTCAP)
+            pulsed = (captured ^ self._cache["GPIO"]) & ~(
+                input_state ^ self._cache["GPIO"]
+            )
+            self._update_bitmap = (
+                self._update_bitmap | (input_state ^ self._cache["GPIO"]) | pulsed
+            )
+            self._cache["GPIO"] = input_state
+            changed = self._update_bitmap & self._push_mask
+            self._update_bitmap = 0
+            if not changed:
+                return False
+            # Snapshot callbacks, they may be unregistered once the lock is released
+            push_callbacks = tuple(self._push_callbacks)
+
+        # Schedule callbacks on the hass event loop, only for pin that changed
+        # - visit set bits only, lowest first (0-2 iterations typically)
+        while changed:
+            bit = changed & -changed
+            pin = bit.bit_length() - 1
+            if pulsed & bit:
+                self._loop.call_soon_threadsafe(push_callbacks[pin], bool(captured & bit))
+            self._loop.call_soon_threadsafe(push_callbacks[pin], bool(input_state & bit))
+            changed &= changed - 1
+
+        return True
+
+
+class _BusPoller(threading.Thread):
+    """Polling thread shared by the MCP23017 devices of an I2C bus.
+
+    I2C transactions are serialized on a bus, a single thread scans all its devices
+    in turn; it is started with the first device and ends with the last one.
+    """
+
+    # Running pollers, one per I2C bus
+    _pollers = {}
+    _pollers_lock = threading.Lock()
+
+    def __init__(self, bus):
+        """Create a polling thread for I2C {bus}."""
+        threading.Thread.__init__(self, name=f"{DOMAIN}-i2c-{bus}")
+        self._bus = bus
+        self._devices = []
+        self._devices_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        # Devices whose last scan failed, to log errors only once
+        self._failing = set()
+
+    @classmethod
+    def add(cls, bus, device):
+        """Add {device} to the poller of I2C {bus}, starting it if required."""
+        with cls._pollers_lock:
+            poller = cls._pollers.get(bus)
+            if poller is None:
+                poller = cls._pollers[bus] = cls(bus)
+                poller._devices.append(device)
+                poller.start()
+            else:
+                with poller._devices_lock:
+                    poller._devices.append(device)
+                poller.wake()
+        return poller
+
+    def remove(self, device):
+        """Remove {device} from this poller, stopping it with the last device.
+
+        Once returned, {device} is not scanned anymore.
+        """
+        with self._pollers_lock:
+            with self._devices_lock:
+                self._devices.remove(device)
+                self._failing.discard(device)
+                is_last = not self._devices
+            if is_last:
+                self._pollers.pop(self._bus)
+        if is_last:
+            self.wake()
+            self.join()
+
+    def wake(self):
+        """Request an immediate scan and reset back-off."""
+        self._wake_event.set()
 
     def run(self):
-        """Poll all ports once and call corresponding callback if a change is detected."""
-
-        _LOGGER.info("%s start polling thread", self.unique_id)
-
-        while self._run:
-            with self:
-                # Read pin values for bank A and B from device only if there are associated callbacks (minimize # of I2C  transactions)
-                input_state = self._cache["GPIO"]
-                if any(
-                    hasattr(entity, "push_update") for entity in self._entities[0:8]
-                ):
-                    input_state = input_state & 0xFF00 | self[GPIOA]
-                if any(
-                    hasattr(entity, "push_update") for entity in self._entities[8:16]
-                ):
-                    input_state = input_state & 0x00FF | (self[GPIOB] << 8)
-
-                # Check pin values that changed and update input cache
-                self._update_bitmap = self._update_bitmap | (
-                    input_state ^ self._cache["GPIO"]
-                )
-                self._cache["GPIO"] = input_state
-                # Call callback functions only for pin that changed
-                for pin in range(16):
-                    if (self._update_bitmap & 0x1) and hasattr(
-                        self._entities[pin], "push_update"
-                    ):
-                        self._entities[pin].push_update(bool(input_state & 0x1))
-                    input_state >>= 1
-                    self._update_bitmap >>= 1
-
-            time.sleep(DEFAULT_SCAN_RATE)
-
-        _LOGGER.info("%s stop polling thread", self.unique_id)
+        """Scan devices of the bus until there are none left."""
+
+        _LOGGER.info("%s start polling thread", self.name)
+
+        idle_scans = 0
+        while True:
+            with self._devices_lock:
+                if not self._devices:
+                    break
+                changed = False
+                for device in self._devices:
+                    # An I2C error of a device must not stop polling of the others
+                    try:
+                        changed = device.scan() or changed
+                    except OSError as error:
+                        if device not in self._failing:
+                            self._failing.add(device)
+                            _LOGGER.error("%s scan failed (%s)", device.unique_id, error)
+                    else:
+                        if device in self._failing:
+                            self._failing.discard(device)
+                            _LOGGER.info("%s scan recovered", device.unique_id)
+
+            # Back off exponentially while inputs are idle, reset on first change
+            # - wake() interrupts the wait
+            idle_scans = 0 if changed else idle_scans + 1
+            if self._wake_event.wait(
+                min(DEFAULT_SCAN_RATE * (1 << min(idle_scans, 4)), MAX_SCAN_RATE)
+            ):
+                self._wake_event.clear()
+                idle_scans = 0
+
+        _LOGGER.info("%s stop polling thread", self.name)
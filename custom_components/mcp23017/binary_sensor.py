@@ -1,7 +1,5 @@
 """Platform for mcp23017-based binary_sensor."""
 
-import asyncio
-import functools
 import logging
 
 import voluptuous as vol
@@ -31,6 +29,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Option values used when neither set by config flow (options) nor import (data)
+_DEFAULT_OPTIONS = {
+    CONF_INVERT_LOGIC: DEFAULT_INVERT_LOGIC,
+    CONF_PULL_MODE: DEFAULT_PULL_MODE,
+}
+
 _PIN_SCHEMA = vol.Schema({cv.positive_int: cv.string})
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
@@ -50,20 +54,27 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     # Wait for configflow to terminate before processing configuration.yaml
     while setup_entry_status.busy():
-        await asyncio.sleep(0)
+        await setup_entry_status.wait_idle()
+
+    # Entry data shared by all pins
+    data = {
+        CONF_FLOW_PLATFORM: "binary_sensor",
+        CONF_I2C_ADDRESS: config[CONF_I2C_ADDRESS],
+        CONF_INVERT_LOGIC: config[CONF_INVERT_LOGIC],
+        CONF_PULL_MODE: config[CONF_PULL_MODE],
+    }
 
+    # Flows are processed concurrently, platform setup doesn't wait for them as
+    # their entries are forwarded back to this platform
     for pin_number, pin_name in config[CONF_PINS].items():
         hass.async_create_task(
             hass.config_entries.flow.async_init(
                 DOMAIN,
                 context={"source": SOURCE_IMPORT},
                 data={
-                    CONF_FLOW_PLATFORM: "binary_sensor",
+                    **data,
                     CONF_FLOW_PIN_NUMBER: pin_number,
                     CONF_FLOW_PIN_NAME: pin_name,
-                    CONF_I2C_ADDRESS: config[CONF_I2C_ADDRESS],
-                    CONF_INVERT_LOGIC: config[CONF_INVERT_LOGIC],
-                    CONF_PULL_MODE: config[CONF_PULL_MODE],
                 },
             )
         )
@@ -73,11 +84,8 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up a MCP23017 binary_sensor entry."""
 
     binary_sensor_entity = MCP23017BinarySensor(hass, config_entry)
-    binary_sensor_entity.device = await async_get_or_create(
-        hass, config_entry, binary_sensor_entity
-    )
-
-    if await hass.async_add_executor_job(binary_sensor_entity.configure_device):
+    # Attach entity to its device and configure it
+    if await async_get_or_create(hass, config_entry, binary_sensor_entity):
         async_add_entities([binary_sensor_entity])
 
 
@@ -89,6 +97,9 @@ async def async_unload_entry(hass, config_entry):
 class MCP23017BinarySensor(BinarySensorEntity):
     """Represent a binary sensor that uses MCP23017."""
 
+    # State is pushed by the device polling thread, no polling needed from homeassistant
+    _attr_should_poll = False
+
     def __init__(self, hass, config_entry):
         """Initialize the MCP23017 binary sensor."""
         self._state = None
@@ -97,32 +108,29 @@ class MCP23017BinarySensor(BinarySensorEntity):
         self._i2c_address = config_entry.data[CONF_I2C_ADDRESS]
         self._pin_name = config_entry.data[CONF_FLOW_PIN_NAME]
         self._pin_number = config_entry.data[CONF_FLOW_PIN_NUMBER]
+        self._attr_name = self._pin_name
+        self._attr_icon = "mdi:chip"
 
-        # Get invert_logic from config flow (options) or import (data)
-        self._invert_logic = config_entry.options.get(
-            CONF_INVERT_LOGIC,
-            config_entry.data.get(
-                CONF_INVERT_LOGIC,
-                DEFAULT_INVERT_LOGIC
-            )
-        )
-        # Get pull_mode from config flow (options) or import (data)
-        self._pull_mode = config_entry.options.get(
-            CONF_PULL_MODE,
-            config_entry.data.get(
-                CONF_PULL_MODE,
-                DEFAULT_PULL_MODE
-            )
-        )
+        # Device info only depends on i2c address, build it once
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._i2c_address)},
+            "manufacturer": "Microchip",
+            "model": "MCP23017",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
 
-        # Create or update option values for binary_sensor platform
-        hass.config_entries.async_update_entry(
-            config_entry,
-            options={
-                CONF_INVERT_LOGIC: self._invert_logic,
-                CONF_PULL_MODE: self._pull_mode,
-            },
-        )
+        # Get options from config flow (options), import (data) or defaults
+        options = {**_DEFAULT_OPTIONS, **config_entry.data, **config_entry.options}
+        self._invert_logic = options[CONF_INVERT_LOGIC]
+        self._pull_mode = options[CONF_PULL_MODE]
+
+        # Create or update option values for binary_sensor platform (only if required)
+        new_options = {
+            CONF_INVERT_LOGIC: self._invert_logic,
+            CONF_PULL_MODE: self._pull_mode,
+        }
+        if config_entry.options != new_options:
+            hass.config_entries.async_update_entry(config_entry, options=new_options)
 
         # Subscribe to updates of config entry options.
         self._unsubscribe_update_listener = config_entry.add_update_listener(
@@ -136,26 +144,6 @@ class MCP23017BinarySensor(BinarySensorEntity):
             self._pin_name,
         )
 
-    @property
-    def icon(self):
-        """Return device icon for this entity."""
-        return "mdi:chip"
-
-    @property
-    def unique_id(self):
-        """Return a unique_id for this entity."""
-        return f"{self._device.unique_id}-0x{self._pin_number:02x}"
-
-    @property
-    def should_poll(self):
-        """No polling needed from homeassistant for this entity."""
-        return False
-
-    @property
-    def name(self):
-        """Return the name of the entity."""
-        return self._pin_name
-
     @property
     def is_on(self):
         """Return the state of the entity."""
@@ -171,16 +159,6 @@ class MCP23017BinarySensor(BinarySensorEntity):
         """Return the i2c address of the entity."""
         return self._i2c_address
 
-    @property
-    def device_info(self):
-        """Device info."""
-        return {
-            "identifiers": {(DOMAIN, self._i2c_address)},
-            "manufacturer": "Microchip",
-            "model": "MCP23017",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
-
     @property
     def device(self):
         """Get device property."""
@@ -190,25 +168,28 @@ class MCP23017BinarySensor(BinarySensorEntity):
     def device(self, value):
         """Set device property."""
         self._device = value
+        # unique_id is derived from the device one, compute it once
+        self._attr_unique_id = (
+            f"{value.unique_id}-0x{self._pin_number:02x}" if value else None
+        )
 
     @callback
-    async def async_push_update(self, state):
-        """Update the GPIO state."""
+    def async_push_update(self, state):
+        """Update the GPIO state (scheduled by the device polling thread)."""
         self._state = state
-        self.async_schedule_update_ha_state()
+        # State is written when the entity is added if it is not yet
+        if self.hass is not None:
+            self.async_write_ha_state()
 
-    @callback
     async def async_config_update(self, hass, config_entry):
         """Handle update from config entry options."""
         self._invert_logic = config_entry.options[CONF_INVERT_LOGIC]
         if self._pull_mode != config_entry.options[CONF_PULL_MODE]:
             self._pull_mode = config_entry.options[CONF_PULL_MODE]
             await hass.async_add_executor_job(
-                functools.partial(
-                    self._device.set_pullup,
-                    self._pin_number,
-                    bool(self._pull_mode == MODE_UP),
-                )
+                self._device.set_pullup,
+                self._pin_number,
+                bool(self._pull_mode == MODE_UP),
             )
         self.async_schedule_update_ha_state()
 
@@ -218,10 +199,6 @@ class MCP23017BinarySensor(BinarySensorEntity):
 
     # Sync functions executed outside of the hass async loop
 
-    def push_update(self, state):
-        """Signal a state change and call the async counterpart."""
-        asyncio.run_coroutine_threadsafe(self.async_push_update(state), self.hass.loop)
-
     def configure_device(self):
         """Attach instance to a device on the given address and configure it.
 
@@ -231,8 +208,11 @@ class MCP23017BinarySensor(BinarySensorEntity):
         """
         if self.device:
             # Configure entity as input for a binary sensor
-            self._device.set_input(self._pin_number, True)
-            self._device.set_pullup(self._pin_number, bool(self._pull_mode == MODE_UP))
+            self._device.configure_pin(
+                self._pin_number,
+                True,
+                is_pullup=bool(self._pull_mode == MODE_UP),
+            )
 
             return True
 
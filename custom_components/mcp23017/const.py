@@ -16,6 +16,7 @@ CONF_FLOW_PIN_NUMBER = "pin_number"
 CONF_FLOW_PIN_NAME = "pin_name"
 
 DEFAULT_SCAN_RATE = 0.1  # seconds
+MAX_SCAN_RATE = 0.5  # seconds, scan rate back-off limit when inputs are idle
 DEFAULT_I2C_BUS = 1  # use /dev/i2c-{DEFAULT_I2C_BUS}
 DEFAULT_I2C_ADDRESS = 0x20
 
@@ -1,7 +1,5 @@
 """Platform for mcp23017-based switch."""
 
-import asyncio
-import functools
 import logging
 
 import voluptuous as vol
@@ -10,7 +8,6 @@ from . import async_get_or_create, setup_entry_status
 from homeassistant.components.switch import PLATFORM_SCHEMA, ToggleEntity
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.config_entries import SOURCE_IMPORT
-from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
@@ -29,6 +26,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Option values used when neither set by config flow (options) nor import (data)
+_DEFAULT_OPTIONS = {
+    CONF_INVERT_LOGIC: DEFAULT_INVERT_LOGIC,
+    CONF_HW_SYNC: DEFAULT_HW_SYNC,
+}
+
 _SWITCHES_SCHEMA = vol.Schema({cv.positive_int: cv.string})
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
@@ -46,20 +49,27 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     # Wait for configflow to terminate before processing configuration.yaml
     while setup_entry_status.busy():
-        await asyncio.sleep(0)
+        await setup_entry_status.wait_idle()
+
+    # Entry data shared by all pins
+    data = {
+        CONF_FLOW_PLATFORM: "switch",
+        CONF_I2C_ADDRESS: config[CONF_I2C_ADDRESS],
+        CONF_INVERT_LOGIC: config[CONF_INVERT_LOGIC],
+        CONF_HW_SYNC: config[CONF_HW_SYNC],
+    }
 
+    # Flows are processed concurrently, platform setup doesn't wait for them as
+    # their entries are forwarded back to this platform
     for pin_number, pin_name in config[CONF_PINS].items():
         hass.async_create_task(
             hass.config_entries.flow.async_init(
                 DOMAIN,
                 context={"source": SOURCE_IMPORT},
                 data={
-                    CONF_FLOW_PLATFORM: "switch",
+                    **data,
                     CONF_FLOW_PIN_NUMBER: pin_number,
                     CONF_FLOW_PIN_NAME: pin_name,
-                    CONF_I2C_ADDRESS: config[CONF_I2C_ADDRESS],
-                    CONF_INVERT_LOGIC: config[CONF_INVERT_LOGIC],
-                    CONF_HW_SYNC: config[CONF_HW_SYNC],
                 },
             )
         )
@@ -69,11 +79,8 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up a MCP23017 switch entry."""
 
     switch_entity = MCP23017Switch(hass, config_entry)
-    switch_entity.device = await async_get_or_create(
-        hass, config_entry, switch_entity
-    )
-
-    if await hass.async_add_executor_job(switch_entity.configure_device):
+    # Attach entity to its device and configure it
+    if await async_get_or_create(hass, config_entry, switch_entity):
         async_add_entities([switch_entity])
 
 
@@ -85,41 +92,43 @@ async def async_unload_entry(hass, config_entry):
 class MCP23017Switch(ToggleEntity):
     """Represent a switch that uses MCP23017."""
 
+    # State only changes through this entity, no polling needed from homeassistant
+    _attr_should_poll = False
+
     def __init__(self, hass, config_entry):
         """Initialize the MCP23017 switch."""
         self._device = None
-        self._state = None
+        self._attr_is_on = None
+        # Last requested state, ahead of _attr_is_on while a pin write is in flight
+        self._target_is_on = None
 
         self._i2c_address = config_entry.data[CONF_I2C_ADDRESS]
         self._pin_name = config_entry.data[CONF_FLOW_PIN_NAME]
         self._pin_number = config_entry.data[CONF_FLOW_PIN_NUMBER]
+        self._attr_name = self._pin_name
+        self._attr_icon = "mdi:chip"
 
-        # Get invert_logic from config flow (options) or import (data)
-        self._invert_logic = config_entry.options.get(
-            CONF_INVERT_LOGIC,
-            config_entry.data.get(
-                CONF_INVERT_LOGIC,
-                DEFAULT_INVERT_LOGIC
-            )
-        )
+        # Device info only depends on i2c address, build it once
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._i2c_address)},
+            "manufacturer": "Microchip",
+            "model": "MCP23017",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
 
-        # Get hw_sync from config flow (options) or import (data)
-        self._hw_sync = config_entry.options.get(
-            CONF_HW_SYNC,
-            config_entry.data.get(
-                CONF_HW_SYNC,
-                DEFAULT_HW_SYNC
-            )
-        )
+        # Get options from config flow (options), import (data) or defaults
+        options = {**_DEFAULT_OPTIONS, **config_entry.data, **config_entry.options}
+        self._invert_logic = options[CONF_INVERT_LOGIC]
+        self._set_pin_values()
+        self._hw_sync = options[CONF_HW_SYNC]
 
-        # Create or update option values for switch platform
-        hass.config_entries.async_update_entry(
-            config_entry,
-            options={
-                CONF_INVERT_LOGIC: self._invert_logic,
-                CONF_HW_SYNC: self._hw_sync,
-            },
-        )
+        # Create or update option values for switch platform (only if required)
+        new_options = {
+            CONF_INVERT_LOGIC: self._invert_logic,
+            CONF_HW_SYNC: self._hw_sync,
+        }
+        if config_entry.options != new_options:
+            hass.config_entries.async_update_entry(config_entry, options=new_options)
 
         # Subscribe to updates of config entry options
         self._unsubscribe_update_listener = config_entry.add_update_listener(
@@ -133,26 +142,6 @@ class MCP23017Switch(ToggleEntity):
             self._pin_name,
         )
 
-    @property
-    def icon(self):
-        """Return device icon for this entity."""
-        return "mdi:chip"
-
-    @property
-    def unique_id(self):
-        """Return a unique_id for this entity."""
-        return f"{self._device.unique_id}-0x{self._pin_number:02x}"
-
-    @property
-    def name(self):
-        """Return the name of the switch."""
-        return self._pin_name
-
-    @property
-    def is_on(self):
-        """Return true if device is on."""
-        return self._state
-
     @property
     def pin(self):
         """Return the pin number of the entity."""
@@ -163,16 +152,6 @@ class MCP23017Switch(ToggleEntity):
         """Return the i2c address of the entity."""
         return self._i2c_address
 
-    @property
-    def device_info(self):
-        """Device info."""
-        return {
-            "identifiers": {(DOMAIN, self._i2c_address)},
-            "manufacturer": "Microchip",
-            "model": "MCP23017",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
-
     @property
     def device(self):
         """Get device property."""
@@ -182,40 +161,58 @@ class MCP23017Switch(ToggleEntity):
     def device(self, value):
         """Set device property."""
         self._device = value
+        # unique_id is derived from the device one, compute it once
+        self._attr_unique_id = (
+            f"{value.unique_id}-0x{self._pin_number:02x}" if value else None
+        )
 
     async def async_turn_on(self, **kwargs):
         """Turn the device on."""
-        await self.hass.async_add_executor_job(
-            functools.partial(
-                self._device.set_pin_value, self._pin_number, not self._invert_logic
-            )
-        )
-        self._state = True
-        self.schedule_update_ha_state()
+        # Output is already (being) set (e.g. scene replay)
+        if self._target_is_on is True:
+            return
+        self._target_is_on = True
+        try:
+            await self._device.async_set_pin_value(self._pin_number, self._on_value)
+        except OSError:
+            # Write failed, let a retry of the same command through
+            self._target_is_on = self._attr_is_on
+            raise
+        self._attr_is_on = True
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the device off."""
-        await self.hass.async_add_executor_job(
-            functools.partial(
-                self._device.set_pin_value, self._pin_number, self._invert_logic
-            )
-        )
-        self._state = False
-        self.schedule_update_ha_state()
+        # Output is already (being) set (e.g. scene replay)
+        if self._target_is_on is False:
+            return
+        self._target_is_on = False
+        try:
+            await self._device.async_set_pin_value(self._pin_number, self._off_value)
+        except OSError:
+            # Write failed, let a retry of the same command through
+            self._target_is_on = self._attr_is_on
+            raise
+        self._attr_is_on = False
+        self.async_write_ha_state()
 
-    @callback
     async def async_config_update(self, hass, config_entry):
         """Handle update from config entry options."""
         self._invert_logic = config_entry.options[CONF_INVERT_LOGIC]
-        await hass.async_add_executor_job(
-            functools.partial(
-                self._device.set_pin_value,
+        self._set_pin_values()
+        # Pin value is applied by configure_device when not configured yet
+        if self._target_is_on is not None:
+            await self._device.async_set_pin_value(
                 self._pin_number,
-                self._state ^ self._invert_logic,
+                self._on_value if self._target_is_on else self._off_value,
             )
-        )
         self.async_schedule_update_ha_state()
 
+    def _set_pin_values(self):
+        """Set pin values of on/off states according to invert_logic."""
+        self._on_value = not self._invert_logic
+        self._off_value = bool(self._invert_logic)
+
     def unsubscribe_update_listener(self):
         """Remove listener from config entry options."""
         self._unsubscribe_update_listener()
@@ -230,12 +227,20 @@ class MCP23017Switch(ToggleEntity):
         Return True when successful.
         """
         if self.device:
-            # Reset pin value when HW sync is not required
-            if not self._hw_sync:
-                self._device.set_pin_value(self._pin_number, self._invert_logic)
             # Configure entity as output for a switch
-            self._device.set_input(self._pin_number, False)
-            self._state = self._device.get_pin_value(self._pin_number) ^ self._invert_logic
+            # - keep and read back pin value when HW sync is required
+            # - reset pin value (off) otherwise, no readback required
+            if self._hw_sync:
+                self._attr_is_on = (
+                    self._device.configure_pin(self._pin_number, False, readback=True)
+                    == self._on_value
+                )
+            else:
+                self._device.configure_pin(
+                    self._pin_number, False, value=self._off_value
+                )
+                self._attr_is_on = False
+            self._target_is_on = self._attr_is_on
 
             return True
 